@@ -11,6 +11,9 @@ from .models import Author, Book, Customer, Employee, GroupProfile, Order
 
 logger = logging.getLogger(__name__)
 
+# Optional "+", optional leading "1", then 10-15 digits; shared by customer and employee forms
+_PHONE_NUMBER_RE = re.compile(r"^\+?1?\d{10,15}$")
+
 
 class BookForm(forms.ModelForm):
     authors = forms.ModelMultipleChoiceField(
@@ -71,7 +74,7 @@ class CustomerForm(forms.ModelForm):
 
     def clean_phone_number(self):
         phone_number = self.cleaned_data.get("phone_number")
-        if phone_number and not re.match(r"^\+?1?\d{10,15}$", phone_number):
+        if phone_number and not _PHONE_NUMBER_RE.match(phone_number):
             raise forms.ValidationError("Enter a valid phone number (10-15 digits, optional +).")
         return phone_number
 
@@ -259,7 +262,7 @@ class EmployeeForm(forms.ModelForm):
 
     def clean_phone_number(self):
         phone_number = self.cleaned_data.get("phone_number")
-        if phone_number and not re.match(r"^\+?1?\d{10,15}$", phone_number):
+        if phone_number and not _PHONE_NUMBER_RE.match(phone_number):
             raise forms.ValidationError("Enter a valid phone number (10-15 digits, optional +).")
         return phone_number
 
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book_shop_here", "0014_customer_name_required"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="normalized_full_name",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Trim(
+                        django.db.models.functions.text.Concat(
+                            "first_name", models.Value(" "), "last_name"
+                        )
+                    )
+                ),
+                output_field=models.CharField(max_length=201),
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="normalized_full_name",
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Trim(
+                        django.db.models.functions.text.Concat(
+                            "first_name", models.Value(" "), "last_name"
+                        )
+                    )
+                ),
+                output_field=models.CharField(max_length=101),
+            ),
+        ),
+    ]
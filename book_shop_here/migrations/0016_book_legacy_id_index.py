@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("book_shop_here", "0015_customer_employee_normalized_full_name"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="book",
+            name="legacy_id",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=8, null=True, verbose_name="Legacy book ID"
+            ),
+        ),
+    ]
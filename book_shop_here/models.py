@@ -3,13 +3,23 @@ from datetime import date
 
 from django.contrib.auth.models import Group, User
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Concat, Lower, Trim
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 logger = logging.getLogger(__name__)
 
 
+def normalized_full_name_expression():
+    """Database expression for lower("first_name last_name"), used for exact name lookups."""
+    return Lower(Trim(Concat("first_name", models.Value(" "), "last_name")))
+
+
+# Number of INSERT attempts when creating a linked User before giving up on username collisions
+USERNAME_CREATE_ATTEMPTS = 3
+
+
 class GroupProfile(models.Model):
     group = models.OneToOneField(
         Group, on_delete=models.CASCADE, primary_key=True, related_name="profile"
@@ -70,6 +80,12 @@ class Employee(models.Model):
         null=True,
         blank=True,
     )
+    normalized_full_name = models.GeneratedField(
+        expression=normalized_full_name_expression(),
+        output_field=models.CharField(max_length=101),
+        db_persist=True,
+        db_index=True,
+    )
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
@@ -82,12 +98,20 @@ class Employee(models.Model):
         if self.user:  # Auto-sync on save if User exists (e.g., for updates)
             self.sync_user()
 
-    def _generate_username(self):
-        """Generate a unique username based on first and last name."""
-        base_username = f"{self.first_name.lower()}.{self.last_name.lower()}"
+    def _base_username(self):
+        """Username pattern (first.last) before any collision suffix."""
+        return f"{self.first_name.lower()}.{self.last_name.lower()}"
+
+    def _generate_username(self, exclude_pk=None):
+        """Generate a unique username based on first and last name.
+
+        ``exclude_pk`` skips that User in the collision check (when renaming an existing one).
+        """
+        base_username = self._base_username()
+        taken = User.objects.exclude(pk=exclude_pk) if exclude_pk else User.objects.all()
         username = base_username
         counter = 1
-        while User.objects.filter(username=username).exists():
+        while taken.filter(username=username).exists():
             username = f"{base_username}{counter}"
             counter += 1
         return username
@@ -104,15 +128,10 @@ class Employee(models.Model):
         self.user.last_name = self.last_name
         self.user.email = self.email or ""
 
-        base_username = f"{self.first_name.lower()}.{self.last_name.lower()}"
         current_username = self.user.username or ""
         if "." in current_username:
             # Recompute expected unique username, excluding current user
-            expected = base_username
-            counter = 1
-            while User.objects.filter(username=expected).exclude(pk=self.user.pk).exists():
-                expected = f"{base_username}{counter}"
-                counter += 1
+            expected = self._generate_username(exclude_pk=self.user.pk)
             if current_username != expected:
                 self.user.username = expected
         # else: keep custom username without dot
@@ -153,25 +172,40 @@ class Employee(models.Model):
         if not kwargs.get("secondary_address"):
             kwargs["secondary_address"] = "N/A"
 
-        temp_employee = cls(first_name=first_name, last_name=last_name)
-        username = temp_employee._generate_username()
-
-        user = User.objects.create_user(
-            username=username,
-            first_name=first_name,
-            last_name=last_name,
-            email=email or "",
-            password=password,
-        )
-        if group:
-            user.groups.add(group)
-
         # Drop form-only fields if present
         for k in ("password1", "password2"):
             if k in kwargs:
                 kwargs.pop(k)
 
-        employee = cls.objects.create(user=user, **kwargs)
+        temp_employee = cls(first_name=first_name, last_name=last_name)
+        # Optimistically try the base username first (single INSERT on the happy path) and
+        # rely on the UNIQUE constraint on username to detect collisions, including races
+        # with concurrent creations.
+        username = temp_employee._base_username()
+
+        with transaction.atomic():
+            for attempt in range(USERNAME_CREATE_ATTEMPTS):
+                try:
+                    with transaction.atomic():
+                        user = User.objects.create_user(
+                            username=username,
+                            first_name=first_name,
+                            last_name=last_name,
+                            email=email or "",
+                            password=password,
+                        )
+                    break
+                except IntegrityError:
+                    if attempt == USERNAME_CREATE_ATTEMPTS - 1:
+                        raise
+                    # Keep the first.last{n} scheme: sync_user renames dotted usernames back
+                    # to it on the next save, so a random suffix would not survive. Racers may
+                    # pick the same n, but the loser's INSERT fails only once the winner has
+                    # committed, so its next lookup sees that name taken and moves on.
+                    username = temp_employee._generate_username()
+
+            user.groups.add(group)
+            employee = cls.objects.create(user=user, **kwargs)
         return employee
 
 
@@ -218,7 +252,7 @@ class Book(models.Model):
 
     book_id = models.AutoField(primary_key=True)
     legacy_id = models.CharField(
-        max_length=8, blank=True, null=True, verbose_name=_("Legacy book ID")
+        max_length=8, blank=True, null=True, db_index=True, verbose_name=_("Legacy book ID")
     )
     title = models.CharField(max_length=500, verbose_name=_("Book title"), db_index=True)
     cost = models.DecimalField(max_digits=11, decimal_places=2, verbose_name=_("Book cost"))
@@ -291,6 +325,12 @@ class Customer(models.Model):
     state = models.CharField(
         max_length=50, blank=True, null=True, editable=True, verbose_name=_("Customer state")
     )
+    normalized_full_name = models.GeneratedField(
+        expression=normalized_full_name_expression(),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+        db_index=True,
+    )
 
     class Meta:
         constraints = [
@@ -356,10 +396,13 @@ class Order(models.Model):
         # Auto-calculate sale_amount from sum of suggested_retail_price minus discount unless explicitly skipped
         if not getattr(self, "_skip_recalc", False):
             try:
-                if self.pk and self.books.exists():
-                    total = sum(
-                        (book.suggested_retail_price for book in self.books.all()), Decimal("0.00")
-                    )
+                # Single SUM() in the database; None means the order has no books yet
+                total = (
+                    self.books.aggregate(total=models.Sum("suggested_retail_price"))["total"]
+                    if self.pk
+                    else None
+                )
+                if total is not None:
                     discount = getattr(self, "discount_amount", Decimal("0.00")) or Decimal("0.00")
                     amount = total - discount
                     if amount < 0:
@@ -1,8 +1,11 @@
+import copy
 import logging
+import re
 from datetime import date
-from decimal import Decimal, InvalidOperation
+from functools import cache
+from types import MappingProxyType
 
-from django.contrib.auth.models import Group
+from django.contrib.auth.models import Group, User
 from django.db import models
 from rest_framework import serializers
 
@@ -18,10 +21,15 @@ class FlexibleIntegerField(serializers.Field):
         super().__init__(*args, **kwargs)
 
     def to_internal_value(self, data):
-        if data in (None, ""):
+        if data is None or data == "":
             return None
+        # Numeric cells (ints, or whole floats from spreadsheet readers) skip the str round-trip
+        if isinstance(data, int) and not isinstance(data, bool):
+            return data
+        if isinstance(data, float) and data.is_integer():
+            return int(data)
         try:
-            return int(str(data))
+            return int(str(data).strip())
         except (ValueError, TypeError):
             raise serializers.ValidationError("A valid integer is required.") from None
 
@@ -31,10 +39,78 @@ class FlexibleIntegerField(serializers.Field):
 
 logger = logging.getLogger(__name__)
 
+# Separators between multiple author names / book titles in a single import cell
+_AUTHOR_SEPARATOR_RE = re.compile(r"\s*(?:;|,|&| and |\n)\s*")
+_BOOK_TITLE_SEPARATOR_RE = re.compile(r"\s*[;,\n]\s*")
+
+
+@cache
+def _choice_lookup(choices_cls):
+    """Map lowercase labels and values of a TextChoices class to the stored value.
+
+    Built once per choices class (lazily, so translations are only resolved after
+    app loading) and shared by every serializer instance and row.
+    """
+    lookup = {str(label).lower(): value for value, label in choices_cls.choices}
+    lookup.update({value.lower(): value for value in choices_cls.values})
+    return MappingProxyType(lookup)
+
+
+def _require_nonblank(value, label):
+    """Return ``value`` (stripped if a string), raising if it is empty or whitespace."""
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped:
+            return stripped
+    elif value:
+        return value
+    raise serializers.ValidationError(f"{label} is required")
+
 
 class BaseImportSerializer(serializers.ModelSerializer):
     """Base serializer with common null value handling"""
 
+    _choice_classes = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        """Record which TextChoices class backs each choice field of ``Meta.model``."""
+        super().__init_subclass__(**kwargs)
+        model = getattr(getattr(cls, "Meta", None), "model", None)
+        if model is None:
+            return
+        choices_classes = [
+            attr
+            for attr in vars(model).values()
+            if isinstance(attr, type) and issubclass(attr, models.TextChoices)
+        ]
+        cls._choice_classes = MappingProxyType(
+            {
+                field.name: choices_cls
+                for field in model._meta.local_fields
+                if field.choices
+                for choices_cls in choices_classes
+                if [value for value, _label in field.choices] == choices_cls.values
+            }
+        )
+
+    def _choice_map(self, field_name):
+        """Lowercase label/value -> stored value map for a choice field of the model"""
+        return _choice_lookup(self._choice_classes[field_name])
+
+    def get_fields(self):
+        """Build the field set once per class and hand each instance a fresh copy.
+
+        ModelSerializer.get_fields() re-introspects the model on every instantiation,
+        which bulk imports do once per row. Field instances are bound to their
+        serializer, so every instance still gets its own deep copy.
+        """
+        cls = type(self)
+        fields = cls.__dict__.get("_base_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._base_fields = fields
+        return copy.deepcopy(fields)
+
     def handle_null_or_empty(self, value, field_name, default=None):
         """Helper method to handle null/empty values consistently"""
         if value is None or (isinstance(value, str) and value.strip() == ""):
@@ -55,18 +131,20 @@ class AuthorImportSerializer(BaseImportSerializer):
 
     def validate_last_name(self, value):
         """Ensure last_name is not empty"""
-        if not value or (isinstance(value, str) and not value.strip()):
-            raise serializers.ValidationError("Author last name is required")
-        return value.strip() if isinstance(value, str) else value
+        return _require_nonblank(value, "Author last name")
+
+    def _current_year(self):
+        """Current year, computed once and shared through the serializer context"""
+        if "current_year" not in self.context:
+            self.context["current_year"] = date.today().year
+        return self.context["current_year"]
 
     def validate_birth_year(self, value):
         """Handle birth year validation with proper null handling"""
         if value is None or value == "":
             return None
-        if value is None:
-            return None
         year = int(value)
-        if year < 1 or year > date.today().year:
+        if year < 1 or year > self._current_year():
             raise serializers.ValidationError(f"Invalid birth year: {year}")
         return year
 
@@ -74,10 +152,8 @@ class AuthorImportSerializer(BaseImportSerializer):
         """Handle death year validation with proper null handling"""
         if value is None or value == "":
             return None
-        if value is None:
-            return None
         year = int(value)
-        if year < 1 or year > date.today().year + 1:
+        if year < 1 or year > self._current_year() + 1:
             raise serializers.ValidationError(f"Invalid death year: {year}")
         return year
 
@@ -130,53 +206,41 @@ class BookImportSerializer(BaseImportSerializer):
 
     def validate_publication_date(self, value):
         "Ensure proper date format and null handling"
-        if value is not None or value != "":
+        if value is None or not value.strip():
+            return None
+        value = value.strip()
+        # Bare years are the common case in legacy sheets; skip the ISO parser for them
+        if len(value) == 4 and value.isdigit():
             try:
-                pub_date = date.fromisoformat(value)
-            except (ValueError, TypeError):
-                try:
-                    pub_year = int(value)
-                    pub_date = date(pub_year, 1, 1)
-                except (ValueError, TypeError):
-                    raise serializers.ValidationError(
-                        f"Publication date must be in YYYY-MM-DD or YYYY format, got: {value}"
-                    ) from None
-            return pub_date
-        return value
+                return date(int(value), 1, 1)
+            except ValueError:
+                pass  # e.g. "0000"; the parsers below report it as a validation error
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+        try:
+            return date(int(value), 1, 1)
+        except (ValueError, TypeError):
+            raise serializers.ValidationError(
+                f"Publication date must be in YYYY-MM-DD or YYYY format, got: {value}"
+            ) from None
 
     def validate_title(self, value):
         """Ensure title is not empty"""
-        if not value or (isinstance(value, str) and not value.strip()):
-            raise serializers.ValidationError("Book title is required")
-        return value.strip() if isinstance(value, str) else value
+        return _require_nonblank(value, "Book title")
 
     def validate_cost(self, value):
-        """Handle cost validation with proper type conversion"""
-        if value is None or value == "":
-            raise serializers.ValidationError("Cost is required")
-        try:
-            cost = Decimal(str(value))
-            if cost < 0:
-                raise serializers.ValidationError("Cost cannot be negative")
-            return cost
-        except (InvalidOperation, ValueError, TypeError):
-            raise serializers.ValidationError(
-                f"Cost must be a valid number, got: {value}"
-            ) from None
+        """Reject negative amounts; the model-backed DecimalField has already parsed the value"""
+        if value < 0:
+            raise serializers.ValidationError("Cost cannot be negative")
+        return value
 
     def validate_suggested_retail_price(self, value):
-        """Handle price validation with proper type conversion"""
-        if value is None or value == "":
-            raise serializers.ValidationError("Suggested retail price is required")
-        try:
-            price = Decimal(str(value))
-            if price < 0:
-                raise serializers.ValidationError("Price cannot be negative")
-            return price
-        except (InvalidOperation, ValueError, TypeError):
-            raise serializers.ValidationError(
-                f"Suggested retail price must be a valid number, got: {value}"
-            ) from None
+        """Reject negative amounts; the model-backed DecimalField has already parsed the value"""
+        if value < 0:
+            raise serializers.ValidationError("Price cannot be negative")
+        return value
 
     def validate_condition(self, value):
         """Validate book condition"""
@@ -184,12 +248,11 @@ class BookImportSerializer(BaseImportSerializer):
             return Book.Condition.UNRATED
 
         # Handle both display names and values
-        condition_map = {choice[1].lower(): choice[0] for choice in Book.Condition.choices}
-        condition_map.update({choice[0].lower(): choice[0] for choice in Book.Condition.choices})
+        condition_map = self._choice_map("condition")
 
-        value_lower = str(value).lower().strip()
-        if value_lower in condition_map:
-            return condition_map[value_lower]
+        choice = condition_map.get(str(value).strip().lower())
+        if choice is not None:
+            return choice
 
         raise serializers.ValidationError(
             f"Invalid condition: {value}. Valid options: {list(condition_map.keys())}"
@@ -201,12 +264,11 @@ class BookImportSerializer(BaseImportSerializer):
             return Book.BookStatus.PROCESSING
 
         # Handle both display names and values
-        status_map = {choice[1].lower(): choice[0] for choice in Book.BookStatus.choices}
-        status_map.update({choice[0].lower(): choice[0] for choice in Book.BookStatus.choices})
+        status_map = self._choice_map("book_status")
 
-        value_lower = str(value).lower().strip()
-        if value_lower in status_map:
-            return status_map[value_lower]
+        choice = status_map.get(str(value).strip().lower())
+        if choice is not None:
+            return choice
 
         raise serializers.ValidationError(
             f"Invalid book status: {value}. Valid options: {list(status_map.keys())}"
@@ -215,7 +277,8 @@ class BookImportSerializer(BaseImportSerializer):
     def create(self, validated_data):
         """Handle author creation/linking during book creation"""
         author_names = validated_data.pop("author_names", "")
-        book = super().create(validated_data)
+        # No m2m/nested fields remain, so skip ModelSerializer.create's generic handling
+        book = Book.objects.create(**validated_data)
 
         if author_names:
             self._handle_authors(book, author_names)
@@ -227,20 +290,12 @@ class BookImportSerializer(BaseImportSerializer):
         if not author_names.strip():
             return
 
-        # Split by common separators
-        separators = [";", ",", "&", " and ", "\n"]
-        authors = [author_names.strip()]
-
-        for sep in separators:
-            new_authors = []
-            for author in authors:
-                new_authors.extend([a.strip() for a in author.split(sep) if a.strip()])
-            authors = new_authors
+        # Split by common separators in a single pass; a cell without separators
+        # comes back as a one-element list from the same scan
+        authors = [a for a in _AUTHOR_SEPARATOR_RE.split(author_names.strip()) if a]
 
+        names = []
         for author_name in authors:
-            if not author_name:
-                continue
-
             # Parse "Last, First" or "First Last" format
             parts = [p.strip() for p in author_name.split(",")]
             if len(parts) == 2:
@@ -254,13 +309,37 @@ class BookImportSerializer(BaseImportSerializer):
                     last_name = author_name
                     first_name = ""
 
-            # Get or create author
-            author, created = Author.objects.get_or_create(
-                last_name=last_name,
-                first_name=first_name or "",
-                defaults={"first_name": first_name or ""},
-            )
-            book.authors.add(author)
+            names.append((last_name, first_name or ""))
+
+        if names:
+            book.authors.add(*self._resolve_authors(names))
+
+    def _resolve_authors(self, names):
+        """Get or create authors for (last_name, first_name) pairs in bulk.
+
+        Resolved authors are kept in ``context["author_index"]`` so rows sharing the
+        same context (one import batch) reuse them without querying again.
+        """
+        index = self.context.setdefault("author_index", {})
+        wanted = list(dict.fromkeys(names))
+        missing = [key for key in wanted if key not in index]
+
+        if missing:
+            query = models.Q()
+            for last_name, first_name in missing:
+                query |= models.Q(last_name=last_name, first_name=first_name)
+            for author in Author.objects.filter(query).order_by("pk"):
+                index.setdefault((author.last_name, author.first_name), author)
+
+            new_authors = [
+                Author(last_name=last_name, first_name=first_name)
+                for last_name, first_name in missing
+                if (last_name, first_name) not in index
+            ]
+            for author in Author.objects.bulk_create(new_authors):
+                index[(author.last_name, author.first_name)] = author
+
+        return [index[key] for key in wanted]
 
 
 class CustomerImportSerializer(BaseImportSerializer):
@@ -323,15 +402,11 @@ class EmployeeImportSerializer(BaseImportSerializer):
 
     def validate_first_name(self, value):
         """Ensure first_name is not empty"""
-        if not value or (isinstance(value, str) and not value.strip()):
-            raise serializers.ValidationError("Employee first name is required")
-        return value.strip()
+        return _require_nonblank(value, "Employee first name")
 
     def validate_last_name(self, value):
         """Ensure last_name is not empty"""
-        if not value or (isinstance(value, str) and not value.strip()):
-            raise serializers.ValidationError("Employee last name is required")
-        return value.strip()
+        return _require_nonblank(value, "Employee last name")
 
     def validate_email(self, value):
         """Handle email validation with null handling"""
@@ -355,8 +430,6 @@ class EmployeeImportSerializer(BaseImportSerializer):
         - Creates a Django User with an unusable password.
         - Ensures secondary_address has a non-null default string.
         """
-        from django.contrib.auth.models import User
-
         group = validated_data.pop("group_name")
         validated_data["group"] = group
 
@@ -364,11 +437,7 @@ class EmployeeImportSerializer(BaseImportSerializer):
         first = validated_data.get("first_name", "").strip().lower() or "user"
         last = validated_data.get("last_name", "").strip().lower() or "import"
         base_username = f"{first}.{last}".strip(".") or "import.user"
-        username = base_username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}{counter}"
-            counter += 1
+        username = self._unique_username(base_username)
 
         # Create user with unusable password
         user = User(
@@ -386,7 +455,35 @@ class EmployeeImportSerializer(BaseImportSerializer):
             validated_data["secondary_address"] = "N/A"
 
         validated_data["user"] = user
-        return super().create(validated_data)
+        return Employee.objects.create(**validated_data)
+
+    def _unique_username(self, base_username):
+        """Return base_username or the first free numbered variant of it.
+
+        Existing usernames sharing the prefix are loaded with one query per distinct
+        base and kept in ``context["taken_usernames"]``, so later rows of the same
+        import batch resolve collisions without hitting the database.
+        """
+        taken = self.context.setdefault("taken_usernames", {})
+        if base_username not in taken:
+            taken[base_username] = set(
+                User.objects.filter(username__startswith=base_username).values_list(
+                    "username", flat=True
+                )
+            )
+
+        existing = taken[base_username]
+        username = base_username
+        counter = 1
+        while username in existing:
+            username = f"{base_username}{counter}"
+            counter += 1
+
+        # Reserve the name for every cached base it could collide with
+        for base, names in taken.items():
+            if username.startswith(base):
+                names.add(username)
+        return username
 
 
 class OrderImportSerializer(BaseImportSerializer):
@@ -415,12 +512,11 @@ class OrderImportSerializer(BaseImportSerializer):
             raise serializers.ValidationError("Payment method is required")
 
         # Handle both display names and values
-        method_map = {choice[1].lower(): choice[0] for choice in Order.PaymentMethod.choices}
-        method_map.update({choice[0].lower(): choice[0] for choice in Order.PaymentMethod.choices})
+        method_map = self._choice_map("payment_method")
 
-        value_lower = str(value).lower().strip()
-        if value_lower in method_map:
-            return method_map[value_lower]
+        choice = method_map.get(str(value).strip().lower())
+        if choice is not None:
+            return choice
 
         raise serializers.ValidationError(f"Invalid payment method: {value}")
 
@@ -430,12 +526,11 @@ class OrderImportSerializer(BaseImportSerializer):
             return Order.OrderStatus.PICKUP
 
         # Handle both display names and values
-        status_map = {choice[1].lower(): choice[0] for choice in Order.OrderStatus.choices}
-        status_map.update({choice[0].lower(): choice[0] for choice in Order.OrderStatus.choices})
+        status_map = self._choice_map("order_status")
 
-        value_lower = str(value).lower().strip()
-        if value_lower in status_map:
-            return status_map[value_lower]
+        choice = status_map.get(str(value).strip().lower())
+        if choice is not None:
+            return choice
 
         raise serializers.ValidationError(f"Invalid order status: {value}")
 
@@ -457,7 +552,7 @@ class OrderImportSerializer(BaseImportSerializer):
             raise serializers.ValidationError(f"Employee not found: {employee_name}")
         validated_data["employee_id"] = employee
 
-        order = super().create(validated_data)
+        order = Order.objects.create(**validated_data)
 
         # Handle books
         if book_titles:
@@ -465,72 +560,119 @@ class OrderImportSerializer(BaseImportSerializer):
 
         return order
 
+    @classmethod
+    def prime_cache(cls, context):
+        """Build in-memory customer/employee/book indexes for a whole import batch.
+
+        Pass the same ``context`` to every serializer in the batch so name and title
+        lookups become dictionary hits; misses still fall back to the database.
+        """
+        customer_index = {}
+        for customer in Customer.objects.only("pk", "normalized_full_name").order_by("pk"):
+            customer_index.setdefault(customer.normalized_full_name, customer)
+
+        employee_index = {}
+        for employee in Employee.objects.only("pk", "normalized_full_name").order_by("pk"):
+            employee_index.setdefault(employee.normalized_full_name, employee)
+
+        book_title_index = {}
+        book_legacy_index = {}
+        for book in Book.objects.only("pk", "title", "legacy_id").order_by("pk"):
+            book_title_index.setdefault(book.title.lower(), book)
+            if book.legacy_id:
+                book_legacy_index.setdefault(book.legacy_id, book)
+
+        context["customer_index"] = customer_index
+        context["employee_index"] = employee_index
+        context["book_title_index"] = book_title_index
+        context["book_legacy_index"] = book_legacy_index
+        return context
+
     def _find_customer(self, name_str):
         """Find customer by name"""
-        if not name_str.strip():
+        # Normalize once; matches the stored lower("first last") column
+        key = name_str.strip().lower()
+        if not key:
             return None
 
-        # Try exact match first
-        customers = Customer.objects.filter(
-            models.Q(first_name__icontains=name_str) | models.Q(last_name__icontains=name_str)
-        )
+        index = self.context.get("customer_index")
+        if index is not None:
+            customer = index.get(key)
+            if customer is not None:
+                return customer
 
-        if customers.count() == 1:
-            return customers.first()
-        elif customers.count() > 1:
-            # Try more specific matching
-            for customer in customers:
-                full_name = f"{customer.first_name or ''} {customer.last_name or ''}".strip()
-                if full_name.lower() == name_str.lower():
-                    return customer
+        # Indexed exact match on the full name before falling back to partial matches
+        customer = Customer.objects.filter(normalized_full_name=key).order_by("pk").first()
+        if customer is not None:
+            return customer
 
-        return customers.first() if customers.exists() else None
+        return (
+            Customer.objects.filter(
+                models.Q(first_name__icontains=name_str) | models.Q(last_name__icontains=name_str)
+            )
+            .order_by("pk")
+            .first()
+        )
 
     def _find_employee(self, name_str):
         """Find employee by name"""
-        if not name_str.strip():
+        # Normalize once; matches the stored lower("first last") column
+        key = name_str.strip().lower()
+        if not key:
             return None
 
-        employees = Employee.objects.filter(
-            models.Q(first_name__icontains=name_str) | models.Q(last_name__icontains=name_str)
-        )
+        index = self.context.get("employee_index")
+        if index is not None:
+            employee = index.get(key)
+            if employee is not None:
+                return employee
 
-        if employees.count() == 1:
-            return employees.first()
-        elif employees.count() > 1:
-            # Try more specific matching
-            for employee in employees:
-                full_name = f"{employee.first_name} {employee.last_name}".strip()
-                if full_name.lower() == name_str.lower():
-                    return employee
+        # Indexed exact match on the full name before falling back to partial matches
+        employee = Employee.objects.filter(normalized_full_name=key).order_by("pk").first()
+        if employee is not None:
+            return employee
 
-        return employees.first() if employees.exists() else None
+        return (
+            Employee.objects.filter(
+                models.Q(first_name__icontains=name_str) | models.Q(last_name__icontains=name_str)
+            )
+            .order_by("pk")
+            .first()
+        )
+
+    def _find_book(self, title):
+        """Find book by legacy_id or title"""
+        legacy_index = self.context.get("book_legacy_index")
+        title_index = self.context.get("book_title_index")
+        if legacy_index is not None and title_index is not None:
+            book = legacy_index.get(title) or title_index.get(title.lower())
+            if book is not None:
+                return book
+
+        # Separate indexed probes instead of one OR the planner can only seq-scan;
+        # exact matches are tried before the partial title match
+        return (
+            Book.objects.filter(legacy_id=title).order_by("pk").first()
+            or Book.objects.filter(title__iexact=title).order_by("pk").first()
+            or Book.objects.filter(title__icontains=title).order_by("pk").first()
+        )
 
     def _handle_books(self, order, book_titles):
         """Find and link books to order"""
         if not book_titles.strip():
             return
 
-        # Split by common separators
-        separators = [";", ",", "\n"]
-        titles = [book_titles.strip()]
-
-        for sep in separators:
-            new_titles = []
-            for title in titles:
-                new_titles.extend([t.strip() for t in title.split(sep) if t.strip()])
-            titles = new_titles
+        # Split by common separators in a single pass
+        titles = [t for t in _BOOK_TITLE_SEPARATOR_RE.split(book_titles.strip()) if t]
 
+        found = []
         for title in titles:
-            if not title:
-                continue
-
-            # Find book by title or legacy_id
-            books = Book.objects.filter(
-                models.Q(title__icontains=title) | models.Q(legacy_id=title)
-            )
-
-            if books.exists():
-                order.books.add(books.first())
+            book = self._find_book(title)
+            if book is not None:
+                found.append(book)
             else:
                 logger.warning(f"Book not found for order {order.order_id}: {title}")
+
+        # One through-table INSERT for the whole order instead of one per title
+        if found:
+            order.books.add(*found)
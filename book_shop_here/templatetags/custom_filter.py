@@ -1,9 +1,19 @@
+from functools import lru_cache
+
 from django import template
 from django.template.defaultfilters import stringfilter
 
 register = template.Library()
 
 
+@lru_cache(maxsize=256)
+def _parse_replace_arg(arg):
+    """Split a "old,new" filter argument once; None when it is malformed."""
+    if "," not in arg:
+        return None
+    return tuple(arg.split(",", 1))
+
+
 @register.filter(is_safe=True)
 @stringfilter
 def replace(value, arg):
@@ -11,8 +21,9 @@ def replace(value, arg):
     Replaces occurrences of a substring with another in a string.
     Usage: {{ value|replace:"old_substring,new_substring" }}
     """
-    if "," not in arg:
+    parsed = _parse_replace_arg(arg)
+    if parsed is None:
         return value  # Handle cases where the argument is not properly formatted
 
-    old_substring, new_substring = arg.split(",", 1)
+    old_substring, new_substring = parsed
     return value.replace(old_substring, new_substring)
@@ -0,0 +1,43 @@
+"""
+Shared builders for the model rows most tests need
+"""
+
+from datetime import date
+
+from book_shop_here.models import Book, Customer, Employee
+
+BOOK_DEFAULTS = {
+    "legacy_id": "test1234",
+    "title": "Test Book",
+    "cost": 10.00,
+    "suggested_retail_price": 15.00,
+    "publication_date": date(2020, 1, 1),
+    "book_status": "available",
+}
+
+EMPLOYEE_DEFAULTS = {
+    "first_name": "Test",
+    "last_name": "Employee",
+    "address": "123 St",
+    "zip_code": "12345",
+    "state": "CA",
+    "birth_date": date(1990, 1, 1),
+    "phone_number": "1234567890",
+}
+
+CUSTOMER_DEFAULTS = {"first_name": "Bob", "last_name": "Jones"}
+
+
+def make_book(**overrides):
+    """Create a Book from BOOK_DEFAULTS with any field overridden."""
+    return Book.objects.create(**{**BOOK_DEFAULTS, **overrides})
+
+
+def make_employee(group, user, **overrides):
+    """Create an Employee in ``group`` linked to an existing ``user``."""
+    return Employee.objects.create(group=group, user=user, **{**EMPLOYEE_DEFAULTS, **overrides})
+
+
+def make_customer(**overrides):
+    """Create a Customer from CUSTOMER_DEFAULTS with any field overridden."""
+    return Customer.objects.create(**{**CUSTOMER_DEFAULTS, **overrides})
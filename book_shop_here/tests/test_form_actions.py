@@ -1,16 +1,15 @@
 from django.contrib.auth.models import Permission, User
-from django.contrib.contenttypes.models import ContentType
-from django.test import Client, TestCase
+from django.db.models import Q
+from django.test import TestCase
 from django.urls import reverse
 
 from book_shop_here.models import Author, Book, Customer, Employee, GroupProfile, Order
 
 
 class FormActionsStylesTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(username="tester", password="pass1234")
-        self.client.login(username="tester", password="pass1234")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="tester", password="pass1234")
 
         # Grant add permissions used by create views
         perms = [
@@ -21,14 +20,24 @@ class FormActionsStylesTests(TestCase):
             ("book_shop_here", "order", "add_order"),
             ("auth", "group", "add_group"),
         ]
+        # One query for all of them instead of a ContentType + Permission lookup per pair
+        query = Q()
         for app_label, model, codename in perms:
-            ct = ContentType.objects.get(app_label=app_label, model=model)
-            perm = Permission.objects.get(content_type=ct, codename=codename)
-            self.user.user_permissions.add(perm)
+            query |= Q(
+                content_type__app_label=app_label,
+                content_type__model=model,
+                codename=codename,
+            )
+        cls.user.user_permissions.add(*Permission.objects.filter(query))
+
+    def setUp(self):
+        self.client.force_login(self.user)
 
     def assertButtons(self, response):
-        self.assertContains(response, "bg-green-600")
-        self.assertContains(response, "bg-red-600")
+        # Each caller asserts the status, so search the raw bytes instead of decoding per check
+        content = response.content
+        self.assertIn(b"bg-green-600", content)
+        self.assertIn(b"bg-red-600", content)
 
     def test_book_create_buttons_colored(self):
         resp = self.client.get(reverse("book_shop_here:book-create"))
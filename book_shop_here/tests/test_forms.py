@@ -4,7 +4,7 @@ from datetime import date
 
 from django.contrib.auth.models import Group, Permission, User
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from book_shop_here.forms import (
     AuthorForm,
@@ -15,43 +15,43 @@ from book_shop_here.forms import (
     OrderForm,
 )
 from book_shop_here.models import Author, Book, Customer, Employee, GroupProfile
+from book_shop_here.tests.factories import make_book, make_customer, make_employee
 
 Logger = logging.getLogger(__name__)
 
+# form.errors renders as HTML, so the apostrophe comes back escaped
+PASSWORD_MISMATCH_HTML = html.escape("Passwords don't match.")
+
+# Valid BookForm fields apart from authors, which each test supplies
+BOOK_FORM_DATA = {
+    "title": "Test Book",
+    "cost": 10.00,
+    "suggested_retail_price": 15.00,
+    "publication_date": date(2020, 1, 1),
+    "publisher": "Test Publisher",
+    "edition": "1st",
+    "condition": "excellent",
+    "book_status": "available",
+    "legacy_id": "doej1234",
+}
+
 
 class BookFormTests(TestCase):
-    def setUp(self):
-        self.author = Author.objects.create(first_name="John", last_name="Doe")
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name="John", last_name="Doe")
 
     def test_book_form_valid(self):
-        form_data = {
-            "title": "Test Book",
-            "cost": 10.00,
-            "suggested_retail_price": 15.00,
-            "publication_date": date(2020, 1, 1),
-            "publisher": "Test Publisher",
-            "edition": "1st",
-            "condition": "excellent",
-            "book_status": "available",
-            "legacy_id": "doej1234",
-            "authors": [self.author.author_id],
-        }
+        form_data = {**BOOK_FORM_DATA, "authors": [self.author.author_id]}
         form = BookForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+
+# An empty authors list fails required-field validation before any queryset lookup,
+# so this case never touches the database
+class BookFormValidationTests(SimpleTestCase):
     def test_book_form_no_authors(self):
-        form_data = {
-            "title": "Test Book",
-            "cost": 10.00,
-            "suggested_retail_price": 15.00,
-            "publication_date": date(2020, 1, 1),
-            "publisher": "Test Publisher",
-            "edition": "1st",
-            "condition": "excellent",
-            "book_status": "available",
-            "legacy_id": "doej1234",
-            "authors": [],
-        }
+        form_data = {**BOOK_FORM_DATA, "authors": []}
         form = BookForm(data=form_data)
         self.assertFalse(form.is_valid())
         self.assertIn("authors", form.errors)
@@ -89,13 +89,12 @@ class CustomerFormTests(TestCase):
 
 
 class GroupFormTests(TestCase):
-    def setUp(self):
+    def test_group_creation_form_valid(self):
+        # Only this test needs a custom permission, so create it here
         ct = ContentType.objects.get_for_model(Book)
         self.perm = Permission.objects.create(
             codename="can_sell_book", name="Can Sell Book", content_type=ct
         )
-
-    def test_group_creation_form_valid(self):
         form_data = {
             "name": "Manager (GroupForm)",
             "description": "Manages store operations",
@@ -123,7 +122,8 @@ class GroupFormTests(TestCase):
         self.assertEqual(group.permissions.count(), 0)
 
 
-class AuthorFormTests(TestCase):
+# AuthorForm validation never touches the database, so skip the per-test transaction
+class AuthorFormTests(SimpleTestCase):
     def test_author_form_valid(self):
         form_data = {
             "first_name": "Jane",
@@ -141,76 +141,48 @@ class AuthorFormTests(TestCase):
 
 
 class OrderFormTests(TestCase):
-    def setUp(self):
-        self.group = Group.objects.create(name="Full Time Sales Clerk (OrderForm)")
-        self.user = User.objects.create_user(username="testuser", password="testpass")
-        self.employee = Employee.objects.create(
-            first_name="Test",
-            last_name="Employee",
-            address="123 St",
-            zip_code="12345",
-            state="CA",
-            birth_date=date(1990, 1, 1),
-            phone_number="1234567890",
-            group=self.group,
-            user=self.user,
-        )
-        self.customer = Customer.objects.create(first_name="Bob", last_name="Jones")
-        self.book = Book.objects.create(
-            legacy_id="test1234",
-            title="Test Book",
-            cost=10.00,
-            suggested_retail_price=15.00,
-            publication_date=date(2020, 1, 1),
-            book_status="available",
-        )
-
-    def test_order_form_valid_manual_amount(self):
-        form_data = {
-            "customer_id": self.customer.customer_id,
-            "employee_id": self.employee.employee_id,
-            "auto_calculate": False,
-            "sale_amount": 10.00,
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Full Time Sales Clerk (OrderForm)")
+        cls.user = User.objects.create_user(username="testuser", password="testpass")
+        cls.employee = make_employee(cls.group, cls.user)
+        cls.customer = make_customer()
+        cls.book = make_book()
+        cls.form_data = {
+            "customer_id": cls.customer.customer_id,
+            "employee_id": cls.employee.employee_id,
             "payment_method": "cash",
             "order_status": "to_ship",
-            "books": [self.book.book_id],
+            "books": [cls.book.book_id],
         }
+
+    def test_order_form_valid_manual_amount(self):
+        form_data = self.form_data.copy()
+        form_data.update(auto_calculate=False, sale_amount=10.00)
         form = OrderForm(data=form_data)
         self.assertTrue(form.is_valid())
         self.assertTrue(self.book.book_status, "processing")
 
     def test_order_form_auto_calculates_with_discount(self):
-        form_data = {
-            "customer_id": self.customer.customer_id,
-            "employee_id": self.employee.employee_id,
-            "auto_calculate": True,
-            "discount_amount": 5.00,
-            "payment_method": "cash",
-            "order_status": "to_ship",
-            "books": [self.book.book_id],
-        }
+        form_data = self.form_data.copy()
+        form_data.update(auto_calculate=True, discount_amount=5.00)
         form = OrderForm(data=form_data)
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data["sale_amount"], self.book.suggested_retail_price - 5)
 
     def test_order_form_no_books(self):
-        form_data = {
-            "customer_id": self.customer.customer_id,
-            "employee_id": self.employee.employee_id,
-            "sale_amount": 10.00,
-            "payment_method": "cash",
-            "order_status": "to_ship",
-            "books": [],
-        }
+        form_data = self.form_data.copy()
+        form_data.update(sale_amount=10.00, books=[])
         form = OrderForm(data=form_data)
         self.assertFalse(form.is_valid())
         self.assertIn("books", form.errors)
 
 
 class EmployeeFormTests(TestCase):
-    def setUp(self):
-        self.group = Group.objects.create(name="Test Group")
-        self.form_data = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Test Group")
+        cls.form_data = {
             "first_name": "John",
             "last_name": "Doe",
             "phone_number": "1234567890",
@@ -221,7 +193,7 @@ class EmployeeFormTests(TestCase):
             "state": "CA",
             "birth_date": date(1990, 1, 1),
             "hire_date": date.today(),
-            "group": self.group.id,
+            "group": cls.group.id,
             "email": "john.doe@example.com",
             "password1": "testpass123",
             "password2": "testpass123",
@@ -249,7 +221,7 @@ class EmployeeFormTests(TestCase):
         data["password2"] = "wrongpass"
         form = EmployeeForm(data=data)
         self.assertFalse(form.is_valid())
-        self.assertIn(html.escape("Passwords don't match."), str(form.errors))
+        self.assertIn(PASSWORD_MISMATCH_HTML, str(form.errors))
 
     def test_form_update(self):
         employee = Employee.create_with_user(
@@ -277,7 +249,7 @@ class EmployeeFormTests(TestCase):
         form = EmployeeForm(data=data, instance=employee)
         self.assertTrue(form.is_valid())
         updated_employee = form.save()
-        updated_employee.user.refresh_from_db()
+        updated_employee.user.refresh_from_db(fields=["first_name", "email", "password"])
         self.assertEqual(updated_employee.user.first_name, "Jane")
         self.assertEqual(updated_employee.user.email, "jane.doe@example.com")
         self.assertTrue(updated_employee.user.check_password("oldpass"))
@@ -299,5 +271,5 @@ class EmployeeFormTests(TestCase):
         form = EmployeeForm(data=data, instance=employee)
         self.assertTrue(form.is_valid())
         updated_employee = form.save()
-        updated_employee.user.refresh_from_db()
+        updated_employee.user.refresh_from_db(fields=["password"])
         self.assertTrue(updated_employee.user.check_password("newpass123"))
@@ -1,26 +1,20 @@
 from datetime import date
+from decimal import Decimal
 
 from django.contrib.auth.models import Group, User
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from book_shop_here.models import Author, Book, Customer, Employee, GroupProfile, Order
+from book_shop_here.tests.factories import make_book, make_customer, make_employee
 
 
 class BookModelTests(TestCase):
-    def setUp(self):
-        self.author = Author.objects.create(first_name="John", last_name="Doe")
-        self.book = Book.objects.create(
-            legacy_id="doej1234",
-            title="Test Book",
-            cost=10.00,
-            suggested_retail_price=15.00,
-            publication_date=date(2020, 1, 1),
-            edition="1st",
-            condition="excellent",
-            book_status="available",
-        )
-        self.book.authors.add(self.author)
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(first_name="John", last_name="Doe")
+        cls.book = make_book(legacy_id="doej1234", edition="1st", condition="excellent")
+        cls.book.authors.add(cls.author)
 
     def test_book_str(self):
         self.assertEqual(str(self.book), "doej1234: Test Book")
@@ -31,8 +25,9 @@ class BookModelTests(TestCase):
 
 
 class AuthorModelTests(TestCase):
-    def setUp(self):
-        self.author = Author.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = Author.objects.create(
             first_name="Jane", last_name="Austen", birth_year=1775, description="Famous novelist"
         )
 
@@ -67,65 +62,82 @@ class CustomerModelTests(TestCase):
 
 
 class OrderModelTests(TestCase):
-    def setUp(self):
-        self.group = Group.objects.create(name="Full Time Sales Clerk (OrderModel)")
-        self.group_profile = GroupProfile.objects.create(group=self.group)
-        self.user = User.objects.create_user(username="testuser", password="testpass")
-        self.employee = Employee.objects.create(
-            first_name="Test",
-            last_name="Employee",
-            address="123 St",
-            zip_code="12345",
-            state="CA",
-            birth_date=date(1990, 1, 1),
-            phone_number="1234567890",
-            group=self.group,
-            user=self.user,
-        )
-        self.customer = Customer.objects.create(first_name="Bob", last_name="Jones")
-        self.book = Book.objects.create(
-            legacy_id="test1234",
-            title="Test Book",
-            cost=10.00,
-            suggested_retail_price=15.00,
-            publication_date=date(2020, 1, 1),
-            book_status="available",
-        )
-        self.order = Order.objects.create(
-            customer_id=self.customer,
-            employee_id=self.employee,
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Full Time Sales Clerk (OrderModel)")
+        cls.group_profile = GroupProfile.objects.create(group=cls.group)
+        cls.user = User.objects.create_user(username="testuser", password="testpass")
+        cls.employee = make_employee(cls.group, cls.user)
+        cls.customer = make_customer()
+        cls.book = make_book()
+        cls.order = Order.objects.create(
+            customer_id=cls.customer,
+            employee_id=cls.employee,
             sale_amount=15.00,
             payment_method="cash",
             order_status="to_ship",
         )
-        self.order.books.add(self.book)
+        cls.order.books.add(cls.book)
 
     def test_completed_order(self):
         self.order.completed_order()
-        self.book.refresh_from_db()
-        self.order.refresh_from_db()
+        # completed_order() sets the order's fields before saving, but re-reads its books
+        self.book.refresh_from_db(fields=["book_status"])
         self.assertEqual(self.book.book_status, "sold")
         self.assertEqual(self.order.order_status, "shipped")
         self.assertEqual(self.order.delivery_pickup_date, date.today())
 
     def test_sale_amount_auto_calculation(self):
-        self.order.books.add(self.book)
+        # The book is already linked in setUpTestData; start from a stale amount so the
+        # assertion only passes if save() recalculates it
+        self.order.sale_amount = Decimal("0.00")
         self.order.save()
-        self.order.refresh_from_db()
+        self.assertEqual(self.order.sale_amount, self.book.suggested_retail_price)
+        # ...and the recalculated amount is what was written
+        self.order.refresh_from_db(fields=["sale_amount"])
         self.assertEqual(self.order.sale_amount, self.book.suggested_retail_price)
 
+    def make_two_book_order(self, discount):
+        """Order for two books totalling 19.75, with a placeholder sale_amount."""
+        order = Order.objects.create(
+            customer_id=self.customer,
+            employee_id=self.employee,
+            sale_amount=Decimal("1.00"),
+            discount_amount=discount,
+            payment_method="cash",
+            order_status="to_ship",
+        )
+        order.books.add(
+            make_book(legacy_id="sumb0001", suggested_retail_price=Decimal("12.50")),
+            make_book(legacy_id="sumb0002", suggested_retail_price=Decimal("7.25")),
+        )
+        return order
+
+    def test_sale_amount_sums_books_minus_discount(self):
+        order = self.make_two_book_order(discount=Decimal("2.25"))
+        order.save()
+        order.refresh_from_db(fields=["sale_amount"])
+        self.assertEqual(order.sale_amount, Decimal("17.50"))
+
+    def test_sale_amount_clamped_when_discount_exceeds_total(self):
+        order = self.make_two_book_order(discount=Decimal("25.00"))
+        order.save()
+        order.refresh_from_db(fields=["sale_amount"])
+        self.assertEqual(order.sale_amount, Decimal("0.00"))
+
 
 class EmployeeModelTests(TestCase):
-    def setUp(self):
-        self.group = Group.objects.create(name="Test Group")
-        self.employee_data = {
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Test Group")
+        cls.employee_data = {
             "first_name": "John",
             "last_name": "Doe",
             "phone_number": "1234567890",
             "address": "123 Main St",
             "birth_date": date(1990, 1, 1),
             "hire_date": date.today(),
-            "group": self.group,
+            "group": cls.group,
             "zip_code": "12345",
             "state": "CA",
             "email": "john.doe@example.com",
@@ -149,7 +161,7 @@ class EmployeeModelTests(TestCase):
         new_group = Group.objects.create(name="New Group")
         employee.group = new_group
         employee.save()
-        employee.user.refresh_from_db()
+        employee.user.refresh_from_db(fields=["first_name", "last_name", "email", "username"])
         self.assertEqual(employee.user.first_name, "Jane")
         self.assertEqual(employee.user.last_name, "Smith")
         self.assertEqual(employee.user.email, "jane.smith@example.com")
@@ -160,14 +172,24 @@ class EmployeeModelTests(TestCase):
     def test_set_password(self):
         employee = Employee.create_with_user(password="oldpass", **self.employee_data)
         employee.set_password("newpass123")
-        employee.user.refresh_from_db()
+        employee.user.refresh_from_db(fields=["password"])
         self.assertTrue(employee.user.check_password("newpass123"))
 
     def test_generate_username_collision(self):
-        User.objects.create_user(username="john.doe", password="pass")
+        # Only the username matters for the collision, so skip hashing a password
+        User.objects.create(username="john.doe")
         employee = Employee.create_with_user(password="testpass123", **self.employee_data)
         self.assertEqual(employee.user.username, "john.doe1")
 
+    def test_sync_user_keeps_suffix_for_colliding_rename(self):
+        User.objects.create(username="jane.smith")
+        employee = Employee.create_with_user(password="testpass123", **self.employee_data)
+        employee.first_name = "Jane"
+        employee.last_name = "Smith"
+        employee.email = "jane.smith@example.com"
+        employee.save()
+        self.assertEqual(employee.user.username, "jane.smith1")
+
     def test_str(self):
         employee = Employee(**self.employee_data)
         self.assertEqual(str(employee), "John Doe")
@@ -2,107 +2,127 @@ from datetime import date
 
 from django.contrib.auth.models import Group, Permission, User
 from django.contrib.contenttypes.models import ContentType
-from django.test import Client, TestCase
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from book_shop_here.models import Author, Book, Customer, Employee, GroupProfile, Order
+from book_shop_here.tests.factories import make_employee
 
 
 class SalesReportsTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user(username="testuser", password="testpass")
-        self.client.login(username="testuser", password="testpass")
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="testuser", password="testpass")
 
         # Minimal data
-        self.group = Group.objects.create(name="Owner (Reports)")
-        GroupProfile.objects.create(group=self.group)
-        self.user.groups.add(self.group)
+        cls.group = Group.objects.create(name="Owner (Reports)")
+        GroupProfile.objects.create(group=cls.group)
+        cls.user.groups.add(cls.group)
         # Ensure the role has permissions required to access reports
-        ct = ContentType.objects.get(app_label="book_shop_here", model="order")
-        needed = Permission.objects.filter(
-            content_type=ct, codename__in=["view_sales_reports", "view_employee_sales"]
-        )
+        # get_for_model() is served from ContentType's process-wide cache after first use
+        ct = ContentType.objects.get_for_model(Order)
+        required = {
+            "view_sales_reports": "Can view sales reports",
+            "view_employee_sales": "Can view employee sales",
+        }
         # If they don't exist yet (e.g., migrations timing in test runner), create minimal stand-ins
-        if needed.count() < 2:
-            for codename, name in (
-                ("view_sales_reports", "Can view sales reports"),
-                ("view_employee_sales", "Can view employee sales"),
-            ):
-                Permission.objects.get_or_create(
-                    codename=codename, content_type=ct, defaults={"name": name}
-                )
-            needed = Permission.objects.filter(
-                content_type=ct, codename__in=["view_sales_reports", "view_employee_sales"]
+        existing = set(
+            Permission.objects.filter(content_type=ct, codename__in=required).values_list(
+                "codename", flat=True
             )
-        self.group.permissions.add(*list(needed))
-
-        self.emp_user = User.objects.create_user(username="empuser", password="testpass")
-        self.employee = Employee.objects.create(
-            first_name="Ella",
-            last_name="Seller",
-            address="123 St",
-            zip_code="12345",
-            state="CA",
-            birth_date=date(1990, 1, 1),
-            phone_number="1234567890",
-            group=self.group,
-            user=self.emp_user,
-            email="ella@example.com",
+        )
+        missing = [
+            Permission(codename=codename, name=name, content_type=ct)
+            for codename, name in required.items()
+            if codename not in existing
+        ]
+        if missing:
+            Permission.objects.bulk_create(missing, ignore_conflicts=True)
+        cls.group.permissions.add(
+            *Permission.objects.filter(content_type=ct, codename__in=required)
         )
 
-        self.customer1 = Customer.objects.create(first_name="Alice", last_name="Smith")
-        self.customer2 = Customer.objects.create(first_name="Bob", last_name="Jones")
-
-        self.author = Author.objects.create(first_name="Jane", last_name="Austen")
-        self.book1 = Book.objects.create(
-            legacy_id="bk000001",
-            title="Pride and Prejudice",
-            cost=10.00,
-            suggested_retail_price=20.00,
-            book_status="available",
+        cls.emp_user = User.objects.create_user(username="empuser", password="testpass")
+        cls.employee = make_employee(
+            cls.group, cls.emp_user, first_name="Ella", last_name="Seller", email="ella@example.com"
         )
-        self.book2 = Book.objects.create(
-            legacy_id="bk000002",
-            title="Sense and Sensibility",
-            cost=12.00,
-            suggested_retail_price=24.00,
-            book_status="available",
+
+        cls.customer1, cls.customer2 = Customer.objects.bulk_create(
+            [
+                Customer(first_name="Alice", last_name="Smith"),
+                Customer(first_name="Bob", last_name="Jones"),
+            ]
         )
-        self.book1.authors.add(self.author)
-        self.book2.authors.add(self.author)
 
-        # Completed order (shipped) with 2 books to customer1
-        self.order1 = Order.objects.create(
-            customer_id=self.customer1,
-            employee_id=self.employee,
-            sale_amount=44.00,
-            discount_amount=4.00,
-            payment_method="cash",
-            order_status="shipped",
+        cls.author = Author.objects.create(first_name="Jane", last_name="Austen")
+        cls.book1, cls.book2 = Book.objects.bulk_create(
+            [
+                Book(
+                    legacy_id="bk000001",
+                    title="Pride and Prejudice",
+                    cost=10.00,
+                    suggested_retail_price=20.00,
+                    book_status="available",
+                ),
+                Book(
+                    legacy_id="bk000002",
+                    title="Sense and Sensibility",
+                    cost=12.00,
+                    suggested_retail_price=24.00,
+                    book_status="available",
+                ),
+            ]
         )
-        self.order1.books.add(self.book1, self.book2)
+        cls.author.books.add(cls.book1, cls.book2)
 
-        # Completed order (picked_up) with 1 book to customer2
-        self.order2 = Order.objects.create(
-            customer_id=self.customer2,
-            employee_id=self.employee,
-            sale_amount=20.00,
-            discount_amount=0,
-            payment_method="credit",
-            order_status="picked_up",
+        # Orders start without books, so Order.save() would have nothing to recalculate;
+        # one INSERT covers all three
+        cls.order1, cls.order2, cls.order3 = Order.objects.bulk_create(
+            [
+                # Completed order (shipped) with 2 books to customer1
+                Order(
+                    customer_id=cls.customer1,
+                    employee_id=cls.employee,
+                    sale_amount=44.00,
+                    discount_amount=4.00,
+                    payment_method="cash",
+                    order_status="shipped",
+                ),
+                # Completed order (picked_up) with 1 book to customer2
+                Order(
+                    customer_id=cls.customer2,
+                    employee_id=cls.employee,
+                    sale_amount=20.00,
+                    discount_amount=0,
+                    payment_method="credit",
+                    order_status="picked_up",
+                ),
+                # Open order should be ignored in completed metrics
+                Order(
+                    customer_id=cls.customer1,
+                    employee_id=cls.employee,
+                    sale_amount=24.00,
+                    payment_method="check",
+                    order_status="to_ship",
+                ),
+            ]
         )
-        self.order2.books.add(self.book1)
 
-        # Open order should be ignored in completed metrics
-        self.order3 = Order.objects.create(
-            customer_id=self.customer1,
-            employee_id=self.employee,
-            sale_amount=24.00,
-            payment_method="check",
-            order_status="to_ship",
+        # Link every order's books with one through-table INSERT
+        OrderBook = Order.books.through
+        OrderBook.objects.bulk_create(
+            [
+                OrderBook(order=cls.order1, book=cls.book1),
+                OrderBook(order=cls.order1, book=cls.book2),
+                OrderBook(order=cls.order2, book=cls.book1),
+                OrderBook(order=cls.order3, book=cls.book2),
+            ]
         )
-        self.order3.books.add(self.book2)
+
+    def setUp(self):
+        self.client.force_login(self.user)
 
     def test_employee_sales_view(self):
         url = reverse("book_shop_here:employee-sales", args=[self.employee.pk])
@@ -132,3 +152,45 @@ class SalesReportsTests(TestCase):
         # Payment breakdown includes cash and credit
         methods = {row["payment_method"] for row in resp.context["payment_breakdown"]}
         self.assertTrue({"cash", "credit"}.issubset(methods))
+
+    def add_completed_orders(self, count):
+        """Add ``count`` shipped orders for the employee, each with its own customer and book."""
+        customers = Customer.objects.bulk_create(
+            [Customer(first_name=f"Extra{i}", last_name="Buyer") for i in range(count)]
+        )
+        books = Book.objects.bulk_create(
+            [
+                Book(title=f"Extra Book {i}", cost=5.00, suggested_retail_price=9.00)
+                for i in range(count)
+            ]
+        )
+        orders = Order.objects.bulk_create(
+            [
+                Order(
+                    customer_id=customer,
+                    employee_id=self.employee,
+                    sale_amount=9.00,
+                    payment_method="cash",
+                    order_status="shipped",
+                )
+                for customer in customers
+            ]
+        )
+        OrderBook = Order.books.through
+        OrderBook.objects.bulk_create(
+            [OrderBook(order=order, book=book) for order, book in zip(orders, books, strict=True)]
+        )
+
+    def test_report_query_counts_independent_of_rows(self):
+        for url in (
+            reverse("book_shop_here:employee-sales", args=[self.employee.pk]),
+            reverse("book_shop_here:sales-dashboard"),
+        ):
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as baseline:
+                    self.client.get(url)
+                self.add_completed_orders(3)
+                # Reports aggregate in the database, so more orders must not mean more queries
+                with self.assertNumQueries(len(baseline)):
+                    resp = self.client.get(url)
+                self.assertEqual(resp.status_code, 200)
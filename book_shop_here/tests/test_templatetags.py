@@ -0,0 +1,19 @@
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from book_shop_here.templatetags.custom_filter import replace
+
+
+class ReplaceFilterTests(SimpleTestCase):
+    def test_replace_substring(self):
+        self.assertEqual(replace("to_ship", "_, "), "to ship")
+
+    def test_malformed_argument_returns_value(self):
+        self.assertEqual(replace("to_ship", "_"), "to_ship")
+
+    def test_replace_in_template(self):
+        template = Template(
+            '{% load custom_filter %}{% for s in items %}{{ s|replace:"_, " }}|{% endfor %}'
+        )
+        rendered = template.render(Context({"items": ["to_ship", "picked_up"]}))
+        self.assertEqual(rendered, "to ship|picked up|")
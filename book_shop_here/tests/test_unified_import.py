@@ -6,23 +6,27 @@ import csv
 import io
 import xml.etree.ElementTree as ET
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.contrib.auth.models import Group, User
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.test import TestCase
 
 from book_shop_here.models import Author, Book, Customer
-from book_shop_here.unified_import import UnifiedImportHandler
+from book_shop_here.serializers import BookImportSerializer
+from book_shop_here.unified_import import UnifiedImportHandler, _import_records_by_type
 
 
 class CSVImportTest(TestCase):
     """Test CSV import functionality"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("testuser", "test@test.com", "testpass")
+        cls.group = Group.objects.create(name="Staff")
+
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user("testuser", "test@test.com", "testpass")
-        self.group = Group.objects.create(name="Staff")
-        self.client.login(username="testuser", password="testpass")
+        self.client.force_login(self.user)
 
     def create_csv_content(self, headers, rows):
         """Helper to create CSV content"""
@@ -139,10 +143,12 @@ class CSVImportTest(TestCase):
 class XMLImportTest(TestCase):
     """Test XML import functionality"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("testuser", "test@test.com", "testpass")
+
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user("testuser", "test@test.com", "testpass")
-        self.client.login(username="testuser", password="testpass")
+        self.client.force_login(self.user)
 
     def create_xml_content(self, root_tag, items):
         """Helper to create XML content"""
@@ -294,11 +300,13 @@ class XMLImportTest(TestCase):
 class UnifiedImportIntegrationTest(TestCase):
     """Integration tests for unified import"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@test.com", "admin123")
+        cls.group = Group.objects.create(name="Staff")
+
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_superuser("admin", "admin@test.com", "admin123")
-        self.group = Group.objects.create(name="Staff")
-        self.client.login(username="admin", password="admin123")
+        self.client.force_login(self.user)
 
     def test_import_csv_authors(self):
         """Test end-to-end CSV import of authors"""
@@ -389,3 +397,46 @@ class UnifiedImportIntegrationTest(TestCase):
         self.assertEqual(response.status_code, 400)
         data = response.json()
         self.assertIn("error", data)
+
+
+class ImportBatchTransactionTest(TestCase):
+    """Test per-row savepoints inside the batch import transaction"""
+
+    MAPPINGS = {
+        "book": {
+            "title": "title",
+            "cost": "cost",
+            "suggested_retail_price": "price",
+            "author_names": "author",
+        }
+    }
+
+    def test_failing_row_rolled_back_and_caches_reset(self):
+        """Test a row raising in save() is reported and later rows link real authors"""
+        records = [
+            {"title": "Emma", "cost": "5", "price": "10", "author": "Jane Austen"},
+            {"title": "Doomed", "cost": "5", "price": "10", "author": "Anne Bronte"},
+            {"title": "Agnes Grey", "cost": "5", "price": "10", "author": "Anne Bronte"},
+        ]
+        handle_authors = BookImportSerializer._handle_authors
+
+        def fail_after_authors(serializer, book, author_names):
+            # Authors are created and cached first, so the rollback must invalidate them
+            handle_authors(serializer, book, author_names)
+            if book.title == "Doomed":
+                raise RuntimeError("boom")
+
+        with patch.object(BookImportSerializer, "_handle_authors", fail_after_authors):
+            results = _import_records_by_type("book", records, self.MAPPINGS)
+
+        self.assertEqual(results["imported"], 2)
+        self.assertEqual(len(results["errors"]), 1)
+        self.assertIn("boom", results["errors"][0])
+
+        self.assertQuerySetEqual(
+            Book.objects.order_by("title").values_list("title", flat=True),
+            ["Agnes Grey", "Emma"],
+        )
+        # The author created by the rolled-back row is gone; the later row made a real one
+        anne = Author.objects.get(last_name="Bronte", first_name="Anne")
+        self.assertEqual(list(Book.objects.get(title="Agnes Grey").authors.all()), [anne])
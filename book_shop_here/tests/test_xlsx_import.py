@@ -9,7 +9,7 @@ from decimal import Decimal
 import pandas as pd
 from django.contrib.auth.models import Group, User
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase
+from django.test import TestCase
 
 from book_shop_here.models import Author, Book, Customer, Employee, Order
 from book_shop_here.serializers import (
@@ -17,14 +17,16 @@ from book_shop_here.serializers import (
     BookImportSerializer,
     CustomerImportSerializer,
     EmployeeImportSerializer,
+    OrderImportSerializer,
 )
 
 
 class NullValueHandlingTest(TestCase):
     """Test null value handling in serializers"""
 
-    def setUp(self):
-        self.group = Group.objects.create(name="Staff")
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Staff")
 
     def test_author_null_values(self):
         """Test author serializer handles null values correctly"""
@@ -45,6 +47,17 @@ class NullValueHandlingTest(TestCase):
         self.assertIsNone(author.birth_year)
         self.assertIsNone(author.death_year)
 
+    def test_author_numeric_years(self):
+        """Test author years accept ints, whole floats from spreadsheets and padded strings"""
+        for raw, expected in ((1775, 1775), (1775.0, 1775), (" 1775 ", 1775)):
+            serializer = AuthorImportSerializer(data={"last_name": "Austen", "birth_year": raw})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            self.assertEqual(serializer.validated_data["birth_year"], expected)
+
+        serializer = AuthorImportSerializer(data={"last_name": "Austen", "birth_year": 1775.5})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("birth_year", serializer.errors)
+
     def test_author_missing_required_field(self):
         """Test author serializer validates required fields"""
         data = {
@@ -77,6 +90,24 @@ class NullValueHandlingTest(TestCase):
         self.assertEqual(book.condition, Book.Condition.UNRATED)
         self.assertEqual(book.book_status, Book.BookStatus.PROCESSING)
 
+    def test_book_publication_date_formats(self):
+        """Test book serializer accepts ISO dates, bare years and nulls"""
+        base = {"title": "Dated Book", "cost": "1.00", "suggested_retail_price": "2.00"}
+
+        for raw, expected in (
+            ("1999-05-04", date(1999, 5, 4)),
+            ("1850", date(1850, 1, 1)),
+            (None, None),
+        ):
+            serializer = BookImportSerializer(data={**base, "publication_date": raw})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            self.assertEqual(serializer.validated_data["publication_date"], expected)
+
+        for raw in ("May 1999", "0000"):
+            serializer = BookImportSerializer(data={**base, "publication_date": raw})
+            self.assertFalse(serializer.is_valid())
+            self.assertIn("publication_date", serializer.errors)
+
     def test_book_with_authors(self):
         """Test book creation with author names"""
         # Create an author first
@@ -98,6 +129,26 @@ class NullValueHandlingTest(TestCase):
         self.assertIn("John Doe", author_names)
         self.assertIn("Jane Smith", author_names)
 
+    def test_book_authors_reused_across_batch(self):
+        """Test authors are created once and reused by rows sharing a context"""
+        Author.objects.create(last_name="Austen", first_name="Jane")
+        context = {}
+
+        for title in ("Emma", "Persuasion"):
+            data = {
+                "title": title,
+                "cost": "5.00",
+                "suggested_retail_price": "9.00",
+                "author_names": "Jane Austen & Mary Shelley & Jane Austen",
+            }
+            serializer = BookImportSerializer(data=data, context=context)
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            book = serializer.save()
+            self.assertEqual(book.authors.count(), 2)
+
+        self.assertEqual(Author.objects.filter(last_name="Austen").count(), 1)
+        self.assertEqual(Author.objects.filter(last_name="Shelley").count(), 1)
+
     def test_customer_null_values(self):
         """Test customer serializer with nullable fields"""
         data = {
@@ -144,15 +195,39 @@ class NullValueHandlingTest(TestCase):
         self.assertEqual(employee.group.name, "Staff")
         self.assertIsNone(employee.email)
 
+    def test_employee_username_collisions_in_batch(self):
+        """Test duplicate names in one batch get distinct numbered usernames"""
+        User.objects.create_user(username="bob.johnson", password="pass")
+        context = {}
+        usernames = []
+
+        for _ in range(2):
+            data = {
+                "first_name": "Bob",
+                "last_name": "Johnson",
+                "phone_number": "555-5678",
+                "address": "123 Main St",
+                "zip_code": "12345",
+                "state": "NY",
+                "group_name": "Staff",
+            }
+            serializer = EmployeeImportSerializer(data=data, context=context)
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            usernames.append(serializer.save().user.username)
+
+        self.assertEqual(usernames, ["bob.johnson1", "bob.johnson2"])
+
 
 class MultiSheetXLSXTest(TestCase):
     """Test multi-sheet XLSX handling"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user("testuser", "test@test.com", "testpass")
+        cls.group = Group.objects.create(name="Admin")
+
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_user("testuser", "test@test.com", "testpass")
-        self.group = Group.objects.create(name="Admin")
-        self.client.login(username="testuser", password="testpass")
+        self.client.force_login(self.user)
 
     def create_test_xlsx(self, sheets_data):
         """Helper to create test XLSX files"""
@@ -277,11 +352,13 @@ class MultiSheetXLSXTest(TestCase):
 class IntegrationTest(TestCase):
     """End-to-end integration tests"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@test.com", "admin123")
+        cls.group = Group.objects.create(name="Staff")
+
     def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create_superuser("admin", "admin@test.com", "admin123")
-        self.group = Group.objects.create(name="Staff")
-        self.client.login(username="admin", password="admin123")
+        self.client.force_login(self.user)
 
     def test_data_wizard_registration(self):
         """Test that models are properly registered with data wizard"""
@@ -304,6 +381,16 @@ class IntegrationTest(TestCase):
         self.assertIn("book_shop_here.serializers.EmployeeImportSerializer", class_names)
         self.assertIn("book_shop_here.serializers.OrderImportSerializer", class_names)
 
+    def test_serializer_fields_not_shared_between_instances(self):
+        """Test cached field definitions are copied per serializer instance"""
+        first = BookImportSerializer(data={})
+        second = BookImportSerializer(data={})
+
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields["title"], second.fields["title"])
+        self.assertIs(first.fields["title"].parent, first)
+        self.assertIs(second.fields["title"].parent, second)
+
     def test_import_books_with_various_conditions(self):
         """Test importing books with different condition formats"""
         test_data = [
@@ -341,6 +428,9 @@ class IntegrationTest(TestCase):
             ("10.99", Decimal("10.99")),
             (10, Decimal("10.00")),
             (10.5, Decimal("10.50")),
+            (0.1, Decimal("0.10")),
+            (" 12.25 ", Decimal("12.25")),
+            (Decimal("7.5"), Decimal("7.50")),
         ]
 
         for input_val, expected in test_cases:
@@ -353,3 +443,79 @@ class IntegrationTest(TestCase):
             self.assertTrue(serializer.is_valid(), f"Failed for {input_val}: {serializer.errors}")
             book = serializer.save()
             self.assertEqual(book.cost, expected)
+
+    def test_invalid_decimal_fields_rejected(self):
+        """Test negative and non-numeric amounts are reported on their field"""
+        for field in ("cost", "suggested_retail_price"):
+            for bad in ("-1.00", "ten"):
+                data = {"title": "Bad Price", "cost": "10", "suggested_retail_price": "20"}
+                data[field] = bad
+                serializer = BookImportSerializer(data=data)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn(field, serializer.errors)
+
+
+class OrderImportTest(TestCase):
+    """Test order import lookups for customers, employees and books"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="Staff")
+        cls.employee = Employee.objects.create(
+            first_name="Ella",
+            last_name="Seller",
+            address="123 St",
+            zip_code="12345",
+            state="CA",
+            phone_number="1234567890",
+            group=cls.group,
+            user=User.objects.create_user(username="ella", password="testpass"),
+        )
+        cls.customer = Customer.objects.create(first_name="Alice", last_name="Smith")
+        cls.book1, cls.book2 = Book.objects.bulk_create(
+            [
+                Book(legacy_id="bk000001", title="Emma", cost=10, suggested_retail_price=20),
+                Book(legacy_id="bk000002", title="Persuasion", cost=12, suggested_retail_price=24),
+            ]
+        )
+        cls.data = {
+            "customer_name": "Alice Smith",
+            "employee_name": "Ella Seller",
+            "sale_amount": "44.00",
+            "payment_method": "cash",
+            "order_status": "shipped",
+            "book_titles": "emma; bk000002",
+        }
+
+    def test_order_import_without_cache(self):
+        """Test lookups fall back to the database when no cache is primed"""
+        serializer = OrderImportSerializer(data=self.data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        order = serializer.save()
+
+        self.assertEqual(order.customer_id, self.customer)
+        self.assertEqual(order.employee_id, self.employee)
+        self.assertEqual(order.payment_method, Order.PaymentMethod.CASH)
+        self.assertEqual(order.order_status, Order.OrderStatus.SHIPPED)
+        self.assertEqual(set(order.books.all()), {self.book1, self.book2})
+
+    def test_order_import_partial_names(self):
+        """Test a single first or last name still matches when no full name does"""
+        serializer = OrderImportSerializer()
+        self.assertEqual(serializer._find_customer("smith"), self.customer)
+        self.assertEqual(serializer._find_employee("Ella"), self.employee)
+        self.assertIsNone(serializer._find_customer("Nobody Here"))
+
+    def test_order_import_with_primed_cache(self):
+        """Test a primed context resolves names and titles without per-row lookups"""
+        context = OrderImportSerializer.prime_cache({})
+
+        serializer = OrderImportSerializer(data=self.data, context=context)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertNumQueries(2):
+            # Order INSERT plus a single through-table INSERT for all linked books
+            order = serializer.save()
+
+        self.assertEqual(order.customer_id, self.customer)
+        self.assertEqual(order.employee_id, self.employee)
+        self.assertEqual(set(order.books.all()), {self.book1, self.book2})
@@ -12,6 +12,7 @@ from typing import Any, TypedDict, cast
 import pandas as pd
 from django.contrib.auth.decorators import login_required
 from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
@@ -787,32 +788,49 @@ def _import_records_by_type(
 
     results: ImportResults = {"imported": 0, "skipped": 0, "errors": []}
 
-    for record in records:
-        try:
-            # Apply column mappings
-            mapped_data: dict[str, Any] = {}
-            for model_field, source_column in type_mappings.items():
-                if source_column in record:
-                    mapped_data[model_field] = record[source_column]
-
-            # Skip empty records
-            if not any(str(v).strip() for v in mapped_data.values()):
-                results["skipped"] += 1
-                continue
+    # Shared by every serializer in this batch so lookup indexes are built only once
+    context: dict[str, Any] = {}
+    prime_cache = getattr(serializer_class, "prime_cache", None)
+    if prime_cache is not None:
+        prime_cache(context)
 
-            # Create and validate
-            serializer = serializer_class(data=mapped_data)
-            if serializer.is_valid():
-                serializer.save()
-                results["imported"] += 1
-            else:
-                error_msg = f"Validation error: {serializer.errors}"
-                results["errors"].append(error_msg)
-                logger.warning(f"Validation failed for {model_type}: {error_msg}")
+    # One transaction for the whole batch instead of a commit per INSERT
+    with transaction.atomic():
+        for record in records:
+            try:
+                # Apply column mappings
+                mapped_data: dict[str, Any] = {}
+                for model_field, source_column in type_mappings.items():
+                    if source_column in record:
+                        mapped_data[model_field] = record[source_column]
+
+                # Skip empty records
+                if not any(str(v).strip() for v in mapped_data.values()):
+                    results["skipped"] += 1
+                    continue
 
-        except Exception as e:
-            error_msg = f"Import error for {model_type} record: {str(e)}"
-            results["errors"].append(error_msg)
-            logger.error(error_msg)
+                # Create and validate
+                serializer = serializer_class(data=mapped_data, context=context)
+                # Savepoint per record so a failing row doesn't abort the batch transaction;
+                # validation runs lookup queries too, so it belongs inside it with save()
+                with transaction.atomic():
+                    valid = serializer.is_valid()
+                    if valid:
+                        serializer.save()
+                if valid:
+                    results["imported"] += 1
+                else:
+                    error_msg = f"Validation error: {serializer.errors}"
+                    results["errors"].append(error_msg)
+                    logger.warning(f"Validation failed for {model_type}: {error_msg}")
+
+            except Exception as e:
+                error_msg = f"Import error for {model_type} record: {str(e)}"
+                results["errors"].append(error_msg)
+                logger.error(error_msg)
+                # Lazily cached lookups may reference rows the savepoint rolled back; the
+                # primed indexes only hold rows that existed before the batch, so keep them
+                for key in ("author_index", "taken_usernames"):
+                    context.pop(key, None)
 
     return results
@@ -37,8 +37,11 @@ class EmployeeSalesView(LoginRequiredMixin, PermissionRequiredMixin, TemplateVie
         if end_date:
             orders_qs = orders_qs.filter(order_date__lte=end_date)
 
-        total_orders = orders_qs.count()
-        total_revenue = orders_qs.aggregate(v=Sum("sale_amount"))["v"] or 0
+        # Order-level totals share one query; the books count joins the M2M, which would
+        # repeat each order's sale_amount, so it stays a separate aggregate
+        order_totals = orders_qs.aggregate(orders=Count("order_id"), revenue=Sum("sale_amount"))
+        total_orders = order_totals["orders"]
+        total_revenue = order_totals["revenue"] or 0
         total_books_sold = orders_qs.aggregate(v=Count("books"))["v"] or 0
 
         sold_books = Book.objects.filter(orders__in=orders_qs).distinct().order_by("-pk")
@@ -98,11 +101,18 @@ class SalesDashboardView(LoginRequiredMixin, PermissionRequiredMixin, TemplateVi
             completed = completed.filter(order_date__lte=end_date)
             open_orders = open_orders.filter(order_date__lte=end_date)
 
-        summary_orders = completed.count()
-        summary_revenue = completed.aggregate(v=Sum("sale_amount"))["v"] or 0
+        # Same split as EmployeeSalesView: order-level figures together, books joined apart
+        order_totals = completed.aggregate(
+            orders=Count("order_id"),
+            revenue=Sum("sale_amount"),
+            discount=Sum("discount_amount"),
+            avg_order_value=Avg("sale_amount"),
+        )
+        summary_orders = order_totals["orders"]
+        summary_revenue = order_totals["revenue"] or 0
         summary_books = completed.aggregate(v=Count("books"))["v"] or 0
-        summary_discount = completed.aggregate(v=Sum("discount_amount"))["v"] or 0
-        summary_avg_order_value = completed.aggregate(v=Avg("sale_amount"))["v"] or 0
+        summary_discount = order_totals["discount"] or 0
+        summary_avg_order_value = order_totals["avg_order_value"] or 0
         logger.debug(summary_avg_order_value)
 
         inventory_by_status = list(
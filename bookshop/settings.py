@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 import environ
@@ -21,6 +22,9 @@ environ.Env.read_env()
 # Set the project base directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# True when running `manage.py test` or pytest; used for test-only speedups below
+TESTING = (len(sys.argv) > 1 and sys.argv[1] == "test") or "pytest" in sys.modules
+
 # Ensure a logs directory exists for file-based logging
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
@@ -99,6 +103,16 @@ WSGI_APPLICATION = "bookshop.wsgi.application"
 
 
 DATABASES = {"default": env.db("DATABASE_URL")}
+# Reuse connections across requests (seconds; 0 closes after each request) and check
+# them before reuse so a dropped PostgreSQL connection doesn't surface as an error
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+
+# Build the test database straight from the current models instead of replaying every
+# migration; CI still applies the real migrations in a separate step
+if TESTING:
+    DATABASES["default"]["TEST"] = {"MIGRATE": False}
 
 
 # Password validation
@@ -120,6 +134,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Tests create and check many passwords; the default PBKDF2 hasher dominates their
+# runtime, so use a fast (insecure) hasher for the test run only
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/